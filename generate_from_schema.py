@@ -5,40 +5,79 @@ Generates all assets from a single presentation schema file.
 """
 
 import openai
-import io
-import requests
-import json
+import orjson
+import hashlib
 import sys
 import os
-import time
+import asyncio
+import functools
+import random
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import aiohttp
 from pathlib import Path
 from PIL import Image
-from tqdm import tqdm
+from tqdm.asyncio import tqdm
 from dotenv import load_dotenv
 from datetime import datetime
 
 # Load environment
 load_dotenv()
-client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+client = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+# Max DALL-E requests in flight at once (keeps us under the per-minute quota)
+MAX_CONCURRENT_REQUESTS = 8
+
+# Retry backoff bounds (seconds)
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+
+# Content-addressed prompt cache, shared across presentations and versions
+CACHE_DIR = Path.home() / ".cache" / "slidegen"
+
+@dataclass(slots=True, frozen=True)
+class AssetSpec:
+    """One background or icon to generate, with derived fields precomputed"""
+    filename: str
+    prompt: str
+    full_prompt: str
+    size: str
+    final_size: tuple
+    alpha: bool
+
+def retry_delay(attempt, retry_after=None):
+    """Exponential backoff with full jitter, honoring a server Retry-After"""
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+@functools.lru_cache(maxsize=8)
+def _load_schema(schema_path, mtime_ns):
+    """Parse and sanity-check a schema file (memoized per path + mtime)"""
+    schema = orjson.loads(Path(schema_path).read_bytes())
 
-def load_presentation_schema(schema_path):
-    """Load and validate presentation schema"""
-    with open(schema_path, 'r') as f:
-        schema = json.load(f)
-    
     required_keys = ['meta', 'visual_identity', 'layout_system', 'slides', 'asset_config']
     for key in required_keys:
         if key not in schema:
             raise ValueError(f"Missing required key in schema: {key}")
-    
+
     return schema
 
-def generate_image(prompt, size, max_retries=3):
+def load_presentation_schema(schema_path):
+    """Load and validate presentation schema"""
+    # mtime in the cache key means edits invalidate the memo automatically
+    return _load_schema(str(schema_path), os.stat(schema_path).st_mtime_ns)
+
+async def generate_image(prompt, size, max_retries=3):
     """Generate image using DALL-E with retry logic"""
     for attempt in range(max_retries):
         try:
-            response = client.images.generate(
+            response = await client.images.generate(
                 model="dall-e-3",
                 prompt=prompt,
                 size=size,
@@ -46,11 +85,23 @@ def generate_image(prompt, size, max_retries=3):
                 response_format="url"
             )
             return response.data[0].url
-        except (requests.exceptions.ConnectionError, ConnectionResetError) as e:
+        except openai.BadRequestError as e:
+            # Content policy rejections never succeed on retry
+            print(f"\n❌ Generation rejected: {e}")
+            return None
+        except openai.RateLimitError as e:
             if attempt < max_retries - 1:
-                wait_time = (attempt + 1) * 5  # 5, 10, 15 seconds
-                print(f"\n⚠️  Connection error, retrying in {wait_time}s... (attempt {attempt + 1}/{max_retries})")
-                time.sleep(wait_time)
+                wait_time = retry_delay(attempt, e.response.headers.get("retry-after"))
+                print(f"\n⚠️  Rate limited, retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
+                await asyncio.sleep(wait_time)
+            else:
+                print(f"\n❌ Rate limited after {max_retries} attempts: {e}")
+                return None
+        except (openai.APIStatusError, openai.APIConnectionError, ConnectionResetError) as e:
+            if attempt < max_retries - 1:
+                wait_time = retry_delay(attempt)
+                print(f"\n⚠️  Connection error, retrying in {wait_time:.1f}s... (attempt {attempt + 1}/{max_retries})")
+                await asyncio.sleep(wait_time)
             else:
                 print(f"\n❌ Connection failed after {max_retries} attempts: {e}")
                 return None
@@ -58,62 +109,130 @@ def generate_image(prompt, size, max_retries=3):
             print(f"\n❌ Generation error: {e}")
             return None
 
-def process_asset(asset_info, style_prompt, asset_config, output_dir):
+def decode_resize_save(buffer, final_size, alpha, cache_path):
+    """Decode, resize, and save one downloaded image (runs in the pool)"""
+    img = Image.open(buffer)
+    if alpha:
+        img = img.convert("RGBA").resize(final_size, Image.LANCZOS)
+    else:
+        # Opaque: stay 3-channel so LANCZOS filters 25% less
+        # data, and let the decoder downscale where it can
+        img.draft("RGB", final_size)
+        img = img.convert("RGB").resize(final_size, Image.LANCZOS)
+    img.save(cache_path, optimize=True)
+
+async def process_asset(spec, style_prompt, output_dir, existing, digests, session, semaphore, executor):
     """Process a single asset (background or icon)"""
-    filename = asset_info['filename']
+    filename = spec.filename
     filepath = output_dir / filename
-    
-    # Skip if exists
-    if filepath.exists():
+    final_size = spec.final_size
+    alpha = spec.alpha
+
+    # Skip if exists (one in-memory check, no stat syscall)
+    if filename in existing:
         return filepath  # Return silently, tqdm will show progress
-    
-    # Determine size and final dimensions
-    if filename.startswith('IC-'):
-        # Icon
-        size = asset_config['dimensions']['icons']['generation_size']
-        final_size = tuple(asset_config['dimensions']['icons']['final_size'])
-    else:
-        # Background
-        size = asset_config['dimensions']['background']['generation_size'] 
-        final_size = tuple(asset_config['dimensions']['background']['final_size'])
-    
-    # Generate image
-    full_prompt = f"{style_prompt} — {asset_info['prompt']}"
-    
-    url = generate_image(full_prompt, size)
-    
-    if url is None:
-        print(f"\n⚠️  Skipping {filename} due to generation failure")
-        return None
-    
-    # Download and process with retry
-    max_download_retries = 3
-    for attempt in range(max_download_retries):
-        try:
-            raw_data = requests.get(url, timeout=30).content
-            img = Image.open(io.BytesIO(raw_data)).convert("RGBA")
-            img = img.resize(final_size, Image.LANCZOS)
-            
-            # Save
-            img.save(filepath)
-            return filepath
-        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
-            if attempt < max_download_retries - 1:
-                wait_time = (attempt + 1) * 2
-                print(f"\n⚠️  Download error, retrying in {wait_time}s...")
-                time.sleep(wait_time)
-            else:
-                print(f"\n❌ Download failed for {filename}: {e}")
-                return None
-        except Exception as e:
-            print(f"\n❌ Processing error for {filename}: {e}")
+
+    # Cache hit: same style + prompt + size was generated before, so skip
+    # the DALL-E call entirely and copy the cached PNG into place. The
+    # cached artifact is the post-resize PNG, so the key must cover the
+    # output parameters too or a final_size edit would serve stale images
+    cache_key = hashlib.sha256(
+        f"{style_prompt}|{spec.prompt}|{spec.size}|{final_size[0]}x{final_size[1]}|{alpha}".encode()
+    ).hexdigest()
+    cache_path = CACHE_DIR / f"{cache_key}.png"
+    if cache_path.exists():
+        shutil.copy2(cache_path, filepath)
+        existing.add(filename)
+        return filepath
+
+    # Generate image (semaphore bounds in-flight API requests)
+    async with semaphore:
+        url = await generate_image(spec.full_prompt, spec.size)
+
+        if url is None:
+            print(f"\n⚠️  Skipping {filename} due to generation failure")
             return None
 
-def generate_presentation_assets(schema_path):
-    """Generate all assets for a presentation from schema"""
-    # Load schema
-    schema = load_presentation_schema(schema_path)
-    
+        # Download and process with retry
+        max_download_retries = 3
+        for attempt in range(max_download_retries):
+            try:
+                # Stream into a spooled buffer so the encoded PNG is never
+                # held as a second full copy in a bytes object
+                with tempfile.SpooledTemporaryFile(max_size=4 << 20) as buffer:
+                    hasher = hashlib.sha256()
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                        async for chunk in response.content.iter_chunked(65536):
+                            hasher.update(chunk)
+                            buffer.write(chunk)
+
+                    # DALL-E occasionally returns byte-identical images for
+                    # repeated prompts; hardlink instead of re-decoding
+                    # (keyed on target size too, so differing outputs never alias)
+                    digest_key = (hasher.hexdigest(), final_size, alpha)
+                    duplicate = digests.get(digest_key)
+                    if duplicate is not None and duplicate.exists():
+                        link_or_copy(duplicate, cache_path)
+                    else:
+                        buffer.seek(0)
+
+                        # Hand decode+resize to the thread pool so the CPU
+                        # work overlaps other downloads instead of blocking
+                        # the loop; saves to the shared cache first, then
+                        # copies into the build
+                        loop = asyncio.get_running_loop()
+                        await loop.run_in_executor(
+                            executor, decode_resize_save, buffer, final_size, alpha, cache_path
+                        )
+                        digests[digest_key] = cache_path
+
+                    # Prompt sidecar for auditability
+                    cache_path.with_suffix('.json').write_bytes(orjson.dumps({
+                        'style_prompt': style_prompt,
+                        'prompt': spec.prompt,
+                        'size': spec.size,
+                        'final_size': list(final_size),
+                        'alpha': alpha
+                    }, option=orjson.OPT_INDENT_2))
+                shutil.copy2(cache_path, filepath)
+                existing.add(filename)
+                return filepath
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < max_download_retries - 1:
+                    wait_time = retry_delay(attempt)
+                    print(f"\n⚠️  Download error, retrying in {wait_time:.1f}s...")
+                    await asyncio.sleep(wait_time)
+                else:
+                    print(f"\n❌ Download failed for {filename}: {e}")
+                    return None
+            except Exception as e:
+                print(f"\n❌ Processing error for {filename}: {e}")
+                return None
+
+async def process_all_assets(all_assets, style_prompt, output_dir, existing):
+    """Process all assets concurrently, bounded by a shared semaphore"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    digests = {}  # (sha256, final_size, alpha) -> cached PNG, shared per run
+
+    # One keep-alive session for the whole run: DALL-E URLs resolve to the
+    # same CDN host, so pooled connections skip the per-download TLS handshake
+    connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # Pillow's C resample releases the GIL, so threads scale across cores
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(process_asset(spec, style_prompt, output_dir, existing, digests, session, semaphore, executor))
+                    for spec in all_assets
+                ]
+                for future in tqdm.as_completed(tasks, desc="Processing assets"):
+                    await future
+
+    return [task.result() for task in tasks]
+
+def generate_presentation_assets(schema, build_dir):
+    """Generate all assets for a presentation from an already-loaded schema"""
     # Setup
     meta = schema['meta']
     visual_identity = schema['visual_identity'] 
@@ -123,35 +242,65 @@ def generate_presentation_assets(schema_path):
     print(f"📋 Theme: {meta['theme']}")
     print(f"🎨 Style: {visual_identity['atmosphere']}")
     
-    # Create output directory (standard name)
-    output_dir = Path("assets_generated")
-    output_dir.mkdir(exist_ok=True)
-    
+    # Output directory (standard name, created by main with the build tree)
+    output_dir = build_dir / "assets_generated"
+
     # Extract style prompt
     style_prompt = visual_identity['style_prompt']
-    
-    # Generate slide backgrounds
-    slide_assets = []
-    for slide in schema['slides']:
-        slide_assets.append({
-            'filename': slide['background']['filename'],
-            'prompt': slide['background']['prompt']
-        })
-    
-    # Generate icons if present
-    icon_assets = []
-    if 'icons' in schema:
-        for icon in schema['icons']:
-            icon_assets.append({
-                'filename': icon['filename'],
-                'prompt': icon['prompt']
-            })
-    
+
+    # Precompute every derived field (full prompt, sizes, alpha) once so the
+    # per-asset loop is plain attribute access on immutable specs
+    dims = asset_config['dimensions']
+
+    def make_spec(filename, prompt):
+        alpha = filename.startswith('IC-')
+        dim_config = dims['icons'] if alpha else dims['background']
+        return AssetSpec(
+            filename=filename,
+            prompt=prompt,
+            full_prompt=f"{style_prompt} — {prompt}",
+            size=dim_config['generation_size'],
+            final_size=tuple(dim_config['final_size']),
+            alpha=alpha
+        )
+
+    # Slide backgrounds
+    slide_assets = [
+        make_spec(slide['background']['filename'], slide['background']['prompt'])
+        for slide in schema['slides']
+    ]
+
+    # Icons if present
+    icon_assets = [
+        make_spec(icon['filename'], icon['prompt'])
+        for icon in schema.get('icons', [])
+    ]
+
     # Generate all assets
     all_assets = slide_assets + icon_assets
-    
+
+    # One scandir pass builds the existence set for the whole run
+    existing = {entry.name for entry in os.scandir(output_dir)}
+
+    # Deduplicate identical prompts: generate each (prompt, type) group once
+    # and copy the result to the other filenames — each avoided call saves
+    # both the dominant latency and the dollar cost
+    groups = {}
+    primaries = []
+    duplicates = []
+    for asset in all_assets:
+        key = (asset.prompt, asset.alpha)
+        if key in groups:
+            duplicates.append((groups[key], asset))
+        else:
+            groups[key] = asset
+            primaries.append(asset)
+
+    if duplicates:
+        print(f"♻️  {len(duplicates)} duplicate prompt(s) will be copied instead of regenerated")
+
     # Count existing assets
-    existing_count = sum(1 for asset in all_assets if (output_dir / asset['filename']).exists())
+    existing_count = sum(1 for asset in all_assets if asset.filename in existing)
     new_count = len(all_assets) - existing_count
     
     if existing_count > 0:
@@ -165,14 +314,25 @@ def generate_presentation_assets(schema_path):
     # Track generation results
     successful = 0
     failed = []
-    
-    for asset in tqdm(all_assets, desc="Processing assets"):
-        result = process_asset(asset, style_prompt, asset_config, output_dir)
+
+    results = asyncio.run(process_all_assets(primaries, style_prompt, output_dir, existing))
+    for asset, result in zip(primaries, results):
         if result is not None:
             successful += 1
         else:
-            if not (output_dir / asset['filename']).exists():
-                failed.append(asset['filename'])
+            if asset.filename not in existing:
+                failed.append(asset.filename)
+
+    # Fan duplicates out from their generated primaries
+    for src_asset, dup_asset in duplicates:
+        if dup_asset.filename in existing:
+            successful += 1
+        elif src_asset.filename in existing:
+            shutil.copy2(output_dir / src_asset.filename, output_dir / dup_asset.filename)
+            existing.add(dup_asset.filename)
+            successful += 1
+        else:
+            failed.append(dup_asset.filename)
     
     print(f"\n✅ Asset processing complete!")
     print(f"📁 Assets saved to: {output_dir}")
@@ -186,10 +346,8 @@ def generate_presentation_assets(schema_path):
     
     return output_dir
 
-def create_slides_json(schema_path, output_path):
-    """Extract slide content from schema for runtime use"""
-    schema = load_presentation_schema(schema_path)
-    
+def create_slides_json(schema, output_path):
+    """Extract slide content from an already-loaded schema for runtime use"""
     # Transform slides for runtime
     runtime_slides = []
     for slide in schema['slides']:
@@ -201,15 +359,22 @@ def create_slides_json(schema_path, output_path):
         runtime_slides.append(runtime_slide)
     
     # Save runtime slides
-    with open(output_path, 'w') as f:
-        json.dump(runtime_slides, f, indent=2)
-    
+    Path(output_path).write_bytes(orjson.dumps(runtime_slides, option=orjson.OPT_INDENT_2))
+
     print(f"📄 Runtime slides saved to: {output_path}")
     return output_path
 
 def get_next_version(presentation_dir):
     """Find the next available version number for a presentation"""
-    version = 1
+    # Fast path: start probing from the pointer file written after each
+    # build instead of from v1. The pointer can be stale (crashed run,
+    # hand-made vN), so the candidate is still verified against the
+    # filesystem before being handed out.
+    try:
+        version = int((presentation_dir / "latest").read_text()) + 1
+    except (FileNotFoundError, ValueError):
+        version = 1
+
     while (presentation_dir / f"v{version}").exists():
         version += 1
     return version
@@ -218,10 +383,17 @@ def find_latest_version(presentation_dir):
     """Find the latest version directory for a presentation"""
     latest_version = None
     latest_dir = None
-    
+
     if not presentation_dir.exists():
         return None
-        
+
+    # Fast path: follow the "current" symlink instead of globbing v*
+    current_link = presentation_dir / "current"
+    if current_link.is_symlink():
+        target = presentation_dir / os.readlink(current_link)
+        if target.is_dir():
+            return target
+
     for path in presentation_dir.glob("v*"):
         if path.is_dir():
             try:
@@ -237,23 +409,32 @@ def find_latest_version(presentation_dir):
     return latest_dir
 
 def copy_existing_assets(previous_dir, new_dir):
-    """Copy assets from previous version to new version"""
+    """Carry assets forward from previous version to new version
+
+    Generated assets are immutable (new versions only ever add files), so
+    hardlinks are safe and cost zero bytes on disk. If you must hand-edit an
+    asset in one version, replace the file (cp --remove-destination) rather
+    than editing in place, or the edit will show up in every linked version.
+    """
     copied_count = 0
-    
-    # Copy assets_generated directory if it exists
+
+    # Link assets_generated directory if it exists
     prev_assets = previous_dir / "assets_generated"
     new_assets = new_dir / "assets_generated"
-    
+
     if prev_assets.exists():
-        new_assets.mkdir(exist_ok=True)
-        
+        # Self-contained: callers may not have created the build tree yet
+        os.makedirs(new_assets, exist_ok=True)
         for asset_file in prev_assets.glob("*"):
             if asset_file.is_file():
                 dest_file = new_assets / asset_file.name
                 if not dest_file.exists():
-                    shutil.copy2(asset_file, dest_file)
+                    try:
+                        os.link(asset_file, dest_file)
+                    except OSError:
+                        shutil.copy2(asset_file, dest_file)
                     copied_count += 1
-                    
+
     return copied_count
 
 def migrate_unversioned_directory(old_dir, new_versioned_dir):
@@ -289,28 +470,39 @@ def save_version_info(build_dir, version, previous_version=None):
     }
     
     version_file = build_dir / "version.json"
-    with open(version_file, 'w') as f:
-        json.dump(version_info, f, indent=2)
+    version_file.write_bytes(orjson.dumps(version_info, option=orjson.OPT_INDENT_2))
+
+def link_or_copy(src, dst):
+    """Hardlink src to dst when possible, falling back to a byte copy"""
+    dst = Path(dst)
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-filesystem or unsupported: copyfile uses sendfile on Linux
+        shutil.copyfile(src, dst)
 
 def copy_template_files(build_dir, script_dir):
     """Copy template HTML and other necessary files to build directory"""
+    # Templates are live, editable files, so a real byte copy (sendfile on
+    # Linux) keeps the build a snapshot; hardlinks are reserved for the
+    # immutable generated assets
     # Copy presentation HTML as index.html
     src_html = script_dir / "presentation_unified.html"
     if src_html.exists():
-        dst_html = build_dir / "index.html"
-        dst_html.write_text(src_html.read_text())
+        shutil.copyfile(src_html, build_dir / "index.html")
         print(f"📄 Copied presentation as: index.html")
     else:
         print(f"⚠️  Template not found: {src_html}")
-    
+
     # Copy other template files
     template_files = ["README.md"]
-    
+
     for filename in template_files:
         src = script_dir / filename
         if src.exists():
-            dst = build_dir / filename
-            dst.write_text(src.read_text())
+            shutil.copyfile(src, build_dir / filename)
             print(f"📄 Copied template: {filename}")
         else:
             print(f"⚠️  Template not found: {src}")
@@ -347,8 +539,7 @@ def main():
         # Use versioning: build/ai-dev/v1, build/ai-dev/v2, etc.
         # Keep original short_name for directory naming
         presentation_dir = Path("build") / short_name
-        presentation_dir.mkdir(parents=True, exist_ok=True)
-        
+
         # Check for old unversioned directory and migrate if needed
         old_unversioned_dir = Path("build") / short_name  # e.g., build/ai-dev
         if old_unversioned_dir.exists() and not any(presentation_dir.glob("v*")):
@@ -363,11 +554,13 @@ def main():
         version = get_next_version(presentation_dir)
         build_dir = presentation_dir / f"v{version}"
         
-    build_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Copy schema to build directory
+    # One makedirs covers the whole build tree down to the assets leaf
+    os.makedirs(build_dir / "assets_generated", exist_ok=True)
+
+    # Copy schema to build directory (byte copy: the source schema keeps
+    # being edited, and the archived copy must not follow those edits)
     build_schema = build_dir / "presentation_schema.json"
-    build_schema.write_text(schema_file.read_text())
+    shutil.copyfile(schema_file, build_schema)
     print(f"📋 Copied schema to: {build_schema}")
     
     print("🎭 Unified Presentation Generator")
@@ -387,22 +580,14 @@ def main():
             print(f"♻️  Copied {copied_assets} existing assets from {previous_dir.name}")
     
     try:
-        # Store script directory before changing working directory
         script_dir = Path(__file__).parent
-        
-        # Temporarily change working directory for generation
-        original_cwd = Path.cwd()
-        os.chdir(build_dir)
-        
-        # Generate assets
-        asset_dir = generate_presentation_assets("presentation_schema.json")
-        
+
+        # Generate assets (schema already parsed once in main)
+        asset_dir = generate_presentation_assets(schema, build_dir)
+
         # Create runtime slides
-        create_slides_json("presentation_schema.json", "slides_runtime.json")
-        
-        # Return to original directory for template copying
-        os.chdir(original_cwd)
-        
+        create_slides_json(schema, build_dir / "slides_runtime.json")
+
         # Copy template files with correct paths
         copy_template_files(build_dir, script_dir)
         
@@ -416,9 +601,10 @@ def main():
                     pass
             save_version_info(build_dir, version, prev_version)
             print(f"📝 Saved version info: version.json")
-            
-            # Create or update "current" symlink
+
+            # Create or update "current" symlink and the "latest" pointer
             presentation_dir = build_dir.parent
+            (presentation_dir / "latest").write_text(str(version))
             current_link = presentation_dir / "current"
             
             # Remove existing symlink if it exists
@@ -446,8 +632,6 @@ def main():
         
     except Exception as e:
         print(f"❌ Error: {e}")
-        if 'original_cwd' in locals():
-            os.chdir(original_cwd)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -7,164 +7,261 @@ Validates presentation JSON files against the defined schema.
 import json
 import sys
 import re
+from collections import Counter
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+# Parse with orjson when available (several times faster in C); stdlib json
+# still handles the failure path for its line/column diagnostics
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# When fastjsonschema is available, compile the shipped JSON Schema once at
+# import into a single generated function that inlines every required/enum/
+# pattern check. A document that passes it only needs the residual checks
+# the schema cannot express; one that fails falls back to the hand-rolled
+# walk for its detailed per-field messages.
+try:
+    import fastjsonschema
+    _fast_validate = fastjsonschema.compile(
+        _loads(Path(__file__).with_name("presentation.schema.json").read_bytes())
+    )
+except (ImportError, OSError):
+    fastjsonschema = None
+    _fast_validate = None
+
+# Compiled once at import: per-call re.match(pattern, ...) re-hashes the
+# pattern string through re's module cache, which evicts wholesale at its
+# size limit, so hot validators pay compile-lookup cost on every call
+_COLOR_RE = re.compile(r'^(?:#[0-9A-Fa-f]{6}|rgba?\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*(?:,\s*[\d.]+)?\s*\))$')
+_SHORT_NAME_RE = re.compile(r'^[a-z0-9-]+$')
+_SLIDE_FN_RE = re.compile(r'^SLIDE-\d{2}-[A-Za-z]+\.png$')
+_ICON_FN_RE = re.compile(r'^IC-[A-Za-z]+\.png$')
+# One pass over the file body both detects and locates block comments,
+# line comments, and trailing commas, replacing the separate substring
+# probes and per-line rescans each issue type used to need. Operates on
+# raw bytes: the file is only decoded on error paths.
+_ISSUE_RE = re.compile(rb'/\*|\*/|^[ \t]*//|,\s*[}\]]', re.MULTILINE)
+
+# Accepted CSS unit suffixes for validate_css_units
+_UNITS = frozenset({'px', 'em', 'rem', 'vw', 'vh', '%'})
+
+# Default for dict.get lookups that feed enum/type/format checks: an
+# explicit JSON null must still reach the check, not read as "absent"
+_MISSING = object()
+
+# Field tables hoisted out of the validators: no per-call (or per-slide) list
+# rebuilding, and membership tests hit a frozenset instead of scanning a list.
+# The enum lists are kept alongside their sets because error messages print them.
+_VALID_LAYOUTS = ["title-slide", "lf", "rf", "tb", "tl", "tr", "bl", "br"]
+_VALID_LAYOUT_SET = frozenset(_VALID_LAYOUTS)
+_VALID_TRANSITIONS = ["none", "fade", "slide", "convex", "concave", "zoom"]
+_VALID_TRANSITION_SET = frozenset(_VALID_TRANSITIONS)
+_VALID_SPEEDS = ["default", "fast", "slow"]
+_VALID_SPEED_SET = frozenset(_VALID_SPEEDS)
+_PRIMARY_COLORS = frozenset({"primary", "secondary", "accent"})
+# Required-field tables come in ordered-tuple + frozenset pairs: the set
+# powers a C-level batch difference on the happy path, the tuple keeps
+# error output in the documented field order when something is missing
+_REQUIRED_META = ("title", "short_name", "version", "created", "theme")
+_REQUIRED_META_SET = frozenset(_REQUIRED_META)
+_REQUIRED_VISUAL = ("colors", "typography", "style_prompt", "atmosphere")
+_REQUIRED_VISUAL_SET = frozenset(_REQUIRED_VISUAL)
+_REQUIRED_ASSET = ("dimensions", "naming_convention", "dalle_model")
+_REQUIRED_ASSET_SET = frozenset(_REQUIRED_ASSET)
+_REQUIRED_RUNTIME = ("reveal_js", "responsive_breakpoints", "content_sizing")
+_REQUIRED_RUNTIME_SET = frozenset(_REQUIRED_RUNTIME)
+_REQUIRED_BACKGROUND = ("filename", "concept", "prompt", "text_zones")
+_REQUIRED_BACKGROUND_SET = frozenset(_REQUIRED_BACKGROUND)
+_REQUIRED_ICON = ("filename", "prompt", "transparent")
+_REQUIRED_ICON_SET = frozenset(_REQUIRED_ICON)
+_REQUIRED_SECTIONS = ("meta", "visual_identity", "layout_system", "asset_config", "slides", "runtime_config")
+_REQUIRED_SECTION_SET = frozenset(_REQUIRED_SECTIONS)
+_REQUIRED_SLIDE = ("id", "layout", "content", "background")
+_REQUIRED_SLIDE_SET = frozenset(_REQUIRED_SLIDE)
+_REQUIRED_COLORS = ("primary", "secondary", "accent", "text_primary", "text_secondary", "overlay_bg", "border")
+_REQUIRED_TYPOGRAPHY = ("font_family", "title_size", "subtitle_size", "body_size", "small_size")
+_REQUIRED_LAYOUT_FIELDS = ("description", "text_position", "text_zone", "max_width")
+_REQUIRED_LAYOUTS = frozenset({"title-slide", "lf", "rf", "tb"})
+_ALL_LAYOUTS = ("title-slide", "lf", "rf", "tb", "tl", "tr", "bl", "br")
+_REQUIRED_REVEAL = ("transition", "transition_speed", "background_transition", "controls", "progress", "keyboard", "touch", "hash")
+_REQUIRED_REVEAL_SET = frozenset(_REQUIRED_REVEAL)
+_REQUIRED_BREAKPOINTS = ("tablet", "mobile")
+
 class SchemaValidator:
     def __init__(self):
         self.errors = []
         self.warnings = []
-    
-    def error(self, message: str):
-        """Add an error message"""
-        self.errors.append(f"❌ ERROR: {message}")
-    
-    def warning(self, message: str):
-        """Add a warning message"""
-        self.warnings.append(f"⚠️  WARNING: {message}")
+
+    def reset(self):
+        """Clear per-file state so the validator can be reused"""
+        self.errors.clear()
+        self.warnings.clear()
+
+    def error(self, message: str, *args):
+        """Record an error; %-formatting is deferred until printed"""
+        self.errors.append((message, args))
+
+    def warning(self, message: str, *args):
+        """Record a warning; %-formatting is deferred until printed"""
+        self.warnings.append((message, args))
     
     def validate_color(self, color: str, field_name: str) -> bool:
         """Validate color format (hex or rgba)"""
-        hex_pattern = r'^#[0-9A-Fa-f]{6}$'
-        rgba_pattern = r'^rgba?\(\s*\d+\s*,\s*\d+\s*,\s*\d+\s*(,\s*[\d.]+)?\s*\)$'
-        
-        if re.match(hex_pattern, color) or re.match(rgba_pattern, color):
+        if _COLOR_RE.match(color):
             return True
         else:
-            self.error(f"{field_name} must be valid hex (#RRGGBB) or rgba() format, got: {color}")
+            self.error("%s must be valid hex (#RRGGBB) or rgba() format, got: %s", field_name, color)
             return False
-    
+
     def validate_version(self, version: str) -> bool:
         """Validate semantic version format"""
-        pattern = r'^\d+\.\d+\.\d+$'
-        if re.match(pattern, version):
+        # x.y.z — plain string checks beat the regex engine for shapes this small
+        parts = version.split('.')
+        if len(parts) == 3 and all(part.isdigit() for part in parts):
             return True
         else:
-            self.error(f"version must be semantic version (x.y.z), got: {version}")
+            self.error("version must be semantic version (x.y.z), got: %s", version)
             return False
-    
+
     def validate_date(self, date: str) -> bool:
         """Validate date format YYYY-MM-DD"""
-        pattern = r'^\d{4}-\d{2}-\d{2}$'
-        if re.match(pattern, date):
+        if (len(date) == 10 and date[4] == '-' and date[7] == '-'
+                and date[:4].isdigit() and date[5:7].isdigit() and date[8:].isdigit()):
             return True
         else:
-            self.error(f"created date must be YYYY-MM-DD format, got: {date}")
+            self.error("created date must be YYYY-MM-DD format, got: %s", date)
             return False
-    
+
     def validate_short_name(self, short_name: str) -> bool:
         """Validate short_name format"""
-        pattern = r'^[a-z0-9-]+$'
-        if re.match(pattern, short_name):
+        if _SHORT_NAME_RE.match(short_name):
             return True
         else:
-            self.error(f"short_name must be lowercase alphanumeric with hyphens only, got: {short_name}")
+            self.error("short_name must be lowercase alphanumeric with hyphens only, got: %s", short_name)
             return False
-    
+
     def validate_dimensions(self, dimensions: str, field_name: str) -> bool:
         """Validate dimension format (e.g., '1792x1024')"""
-        pattern = r'^\d+x\d+$'
-        if re.match(pattern, dimensions):
+        width, sep, height = dimensions.partition('x')
+        if sep and width.isdigit() and height.isdigit():
             return True
         else:
-            self.error(f"{field_name} must be WIDTHxHEIGHT format, got: {dimensions}")
+            self.error("%s must be WIDTHxHEIGHT format, got: %s", field_name, dimensions)
             return False
-    
+
     def validate_slide_id(self, slide_id: str) -> bool:
         """Validate slide ID format (two digits, zero-padded)"""
-        pattern = r'^\d{2}$'
-        if re.match(pattern, slide_id):
+        if len(slide_id) == 2 and slide_id.isdigit():
             return True
         else:
-            self.error(f"slide id must be two-digit zero-padded (e.g., '01'), got: {slide_id}")
+            self.error("slide id must be two-digit zero-padded (e.g., '01'), got: %s", slide_id)
             return False
-    
+
     def validate_filename_pattern(self, filename: str, pattern_type: str) -> bool:
         """Validate filename patterns"""
         if pattern_type == "slide":
-            pattern = r'^SLIDE-\d{2}-[A-Za-z]+\.png$'
-            if re.match(pattern, filename):
+            if _SLIDE_FN_RE.match(filename):
                 return True
             else:
-                self.error(f"slide filename must match 'SLIDE-XX-Concept.png', got: {filename}")
+                self.error("slide filename must match 'SLIDE-XX-Concept.png', got: %s", filename)
                 return False
         elif pattern_type == "icon":
-            pattern = r'^IC-[A-Za-z]+\.png$'
-            if re.match(pattern, filename):
+            if _ICON_FN_RE.match(filename):
                 return True
             else:
-                self.error(f"icon filename must match 'IC-Name.png', got: {filename}")
+                self.error("icon filename must match 'IC-Name.png', got: %s", filename)
                 return False
         return False
-    
+
     def validate_css_units(self, value: str, field_name: str) -> bool:
         """Validate CSS unit values"""
-        # Allow common CSS units
-        pattern = r'^\d+(\.\d+)?(px|em|rem|vw|vh|%)?$'
-        if re.match(pattern, value):
+        # Hottest validator (every typography size plus every layout
+        # max_width), so scan by hand instead of paying regex dispatch:
+        # digits, optional '.' + digits, then an allowed unit suffix or end
+        i = 0
+        n = len(value)
+        while i < n and value[i].isdigit():
+            i += 1
+        if i > 0 and i < n and value[i] == '.':
+            j = i + 1
+            while j < n and value[j].isdigit():
+                j += 1
+            if j > i + 1:
+                i = j
+        if i > 0 and (i == n or value[i:] in _UNITS):
             return True
         else:
-            self.warning(f"{field_name} should use valid CSS units, got: {value}")
+            self.warning("%s should use valid CSS units, got: %s", field_name, value)
             return False
     
     def validate_meta(self, meta: Dict[str, Any]) -> bool:
         """Validate meta section"""
-        required_fields = ["title", "short_name", "version", "created", "theme"]
         valid = True
-        
-        for field in required_fields:
-            if field not in meta:
-                self.error(f"meta.{field} is required")
-                valid = False
-        
-        if "short_name" in meta:
-            valid &= self.validate_short_name(meta["short_name"])
-        
-        if "version" in meta:
-            valid &= self.validate_version(meta["version"])
-        
-        if "created" in meta:
-            valid &= self.validate_date(meta["created"])
+
+        # Batch missing-field check: one C-level set difference on the
+        # happy path, ordered reporting only when something is absent
+        missing = _REQUIRED_META_SET.difference(meta)
+        if missing:
+            valid = False
+            for field in _REQUIRED_META:
+                if field in missing:
+                    self.error("meta.%s is required", field)
+        
+        short_name = meta.get("short_name", _MISSING)
+        if short_name is not _MISSING:
+            valid = self.validate_short_name(short_name) and valid
+
+        version = meta.get("version", _MISSING)
+        if version is not _MISSING:
+            valid = self.validate_version(version) and valid
+
+        created = meta.get("created", _MISSING)
+        if created is not _MISSING:
+            valid = self.validate_date(created) and valid
         
         return valid
     
     def validate_visual_identity(self, visual_identity: Dict[str, Any]) -> bool:
         """Validate visual_identity section"""
-        required_fields = ["colors", "typography", "style_prompt", "atmosphere"]
+        err = self.error
+        css = self.validate_css_units
         valid = True
-        
-        for field in required_fields:
-            if field not in visual_identity:
-                self.error(f"visual_identity.{field} is required")
-                valid = False
+
+        missing = _REQUIRED_VISUAL_SET.difference(visual_identity)
+        if missing:
+            valid = False
+            for field in _REQUIRED_VISUAL:
+                if field in missing:
+                    err("visual_identity.%s is required", field)
         
         # Validate colors
-        if "colors" in visual_identity:
-            colors = visual_identity["colors"]
-            required_colors = ["primary", "secondary", "accent", "text_primary", "text_secondary", "overlay_bg", "border"]
-            
-            for color_field in required_colors:
-                if color_field not in colors:
-                    self.error(f"visual_identity.colors.{color_field} is required")
+        colors = visual_identity.get("colors", _MISSING)
+        if colors is not _MISSING:
+            for color_field in _REQUIRED_COLORS:
+                color = colors.get(color_field, _MISSING)
+                if color is _MISSING:
+                    err("visual_identity.colors.%s is required", color_field)
                     valid = False
-                else:
-                    # Only validate hex format for primary colors
-                    if color_field in ["primary", "secondary", "accent"] and isinstance(colors[color_field], str):
-                        if not colors[color_field].startswith('#'):
-                            self.error(f"visual_identity.colors.{color_field} should be hex format")
-                            valid = False
-        
+                # Only validate hex format for primary colors
+                elif color_field in _PRIMARY_COLORS and isinstance(color, str):
+                    if not color.startswith('#'):
+                        err("visual_identity.colors.%s should be hex format", color_field)
+                        valid = False
+
         # Validate typography
-        if "typography" in visual_identity:
-            typography = visual_identity["typography"]
-            required_typo = ["font_family", "title_size", "subtitle_size", "body_size", "small_size"]
-            
-            for typo_field in required_typo:
-                if typo_field not in typography:
-                    self.error(f"visual_identity.typography.{typo_field} is required")
+        typography = visual_identity.get("typography", _MISSING)
+        if typography is not _MISSING:
+            for typo_field in _REQUIRED_TYPOGRAPHY:
+                value = typography.get(typo_field, _MISSING)
+                if value is _MISSING:
+                    err("visual_identity.typography.%s is required", typo_field)
                     valid = False
                 elif typo_field != "font_family":
-                    self.validate_css_units(typography[typo_field], f"visual_identity.typography.{typo_field}")
+                    css(value, f"visual_identity.typography.{typo_field}")
         
         return valid
     
@@ -172,144 +269,129 @@ class SchemaValidator:
         """Validate layout_system section"""
         valid = True
         
-        if "layouts" not in layout_system:
+        layouts = layout_system.get("layouts", _MISSING)
+        if layouts is _MISSING:
             self.error("layout_system.layouts is required")
             return False
-        
-        layouts = layout_system["layouts"]
-        required_layouts = ["title-slide", "lf", "rf", "tb"]
-        optional_layouts = ["tl", "tr", "bl", "br"]
-        
-        # Validate required layouts
-        for layout_name in required_layouts:
-            if layout_name not in layouts:
-                self.error(f"layout_system.layouts.{layout_name} is required")
-                valid = False
-            else:
-                layout = layouts[layout_name]
-                required_layout_fields = ["description", "text_position", "text_zone", "max_width"]
-                
-                for field in required_layout_fields:
-                    if field not in layout:
-                        self.error(f"layout_system.layouts.{layout_name}.{field} is required")
-                        valid = False
-                    elif field == "max_width":
-                        self.validate_css_units(layout[field], f"layout_system.layouts.{layout_name}.max_width")
-        
-        # Validate optional layouts if present
-        for layout_name in optional_layouts:
-            if layout_name in layouts:
-                layout = layouts[layout_name]
-                required_layout_fields = ["description", "text_position", "text_zone", "max_width"]
-                
-                for field in required_layout_fields:
-                    if field not in layout:
-                        self.error(f"layout_system.layouts.{layout_name}.{field} is required")
-                        valid = False
-                    elif field == "max_width":
-                        self.validate_css_units(layout[field], f"layout_system.layouts.{layout_name}.max_width")
-        
+
+        # Required and optional layouts share the same field checks; one pass
+        # covers both, with only the missing-layout error gated on required
+        for layout_name in _ALL_LAYOUTS:
+            layout = layouts.get(layout_name)
+            if layout is None:
+                if layout_name in _REQUIRED_LAYOUTS:
+                    self.error("layout_system.layouts.%s is required", layout_name)
+                    valid = False
+                continue
+
+            for field in _REQUIRED_LAYOUT_FIELDS:
+                value = layout.get(field, _MISSING)
+                if value is _MISSING:
+                    self.error("layout_system.layouts.%s.%s is required", layout_name, field)
+                    valid = False
+                elif field == "max_width":
+                    self.validate_css_units(value, f"layout_system.layouts.{layout_name}.max_width")
+
         return valid
     
     def validate_asset_config(self, asset_config: Dict[str, Any]) -> bool:
         """Validate asset_config section"""
-        required_fields = ["dimensions", "naming_convention", "dalle_model"]
         valid = True
-        
-        for field in required_fields:
-            if field not in asset_config:
-                self.error(f"asset_config.{field} is required")
-                valid = False
+
+        missing = _REQUIRED_ASSET_SET.difference(asset_config)
+        if missing:
+            valid = False
+            for field in _REQUIRED_ASSET:
+                if field in missing:
+                    self.error("asset_config.%s is required", field)
         
         # Validate dimensions
-        if "dimensions" in asset_config:
-            dimensions = asset_config["dimensions"]
-            required_dims = ["background", "icons"]
-            
-            for dim_type in required_dims:
-                if dim_type not in dimensions:
-                    self.error(f"asset_config.dimensions.{dim_type} is required")
+        dimensions = asset_config.get("dimensions", _MISSING)
+        if dimensions is not _MISSING:
+            for dim_type in ("background", "icons"):
+                dim_config = dimensions.get(dim_type, _MISSING)
+                if dim_config is _MISSING:
+                    self.error("asset_config.dimensions.%s is required", dim_type)
                     valid = False
                 else:
-                    dim_config = dimensions[dim_type]
-                    if "generation_size" not in dim_config:
-                        self.error(f"asset_config.dimensions.{dim_type}.generation_size is required")
+                    generation_size = dim_config.get("generation_size", _MISSING)
+                    if generation_size is _MISSING:
+                        self.error("asset_config.dimensions.%s.generation_size is required", dim_type)
                         valid = False
                     else:
-                        valid &= self.validate_dimensions(
-                            dim_config["generation_size"], 
+                        valid = self.validate_dimensions(
+                            generation_size,
                             f"asset_config.dimensions.{dim_type}.generation_size"
-                        )
-                    
-                    if "final_size" not in dim_config:
-                        self.error(f"asset_config.dimensions.{dim_type}.final_size is required")
+                        ) and valid
+
+                    final_size = dim_config.get("final_size", _MISSING)
+                    if final_size is _MISSING:
+                        self.error("asset_config.dimensions.%s.final_size is required", dim_type)
                         valid = False
-                    elif not isinstance(dim_config["final_size"], list) or len(dim_config["final_size"]) != 2:
-                        self.error(f"asset_config.dimensions.{dim_type}.final_size must be [width, height] array")
+                    elif not isinstance(final_size, list) or len(final_size) != 2:
+                        self.error("asset_config.dimensions.%s.final_size must be [width, height] array", dim_type)
                         valid = False
-        
+
         # Validate dalle_model
-        if "dalle_model" in asset_config:
-            if asset_config["dalle_model"] not in ["dall-e-3", "dall-e-2"]:
-                self.error(f"asset_config.dalle_model must be 'dall-e-3' or 'dall-e-2'")
-                valid = False
+        dalle_model = asset_config.get("dalle_model", _MISSING)
+        if dalle_model is not _MISSING and dalle_model not in ["dall-e-3", "dall-e-2"]:
+            self.error("asset_config.dalle_model must be 'dall-e-3' or 'dall-e-2'")
+            valid = False
         
         return valid
     
     def validate_slides(self, slides: List[Dict[str, Any]]) -> bool:
         """Validate slides section"""
+        err = self.error
         valid = True
         
         if not slides:
-            self.error("slides array cannot be empty")
+            err("slides array cannot be empty")
             return False
         
-        slide_ids = set()
-        
+        slide_ids = []
+
         for i, slide in enumerate(slides):
-            required_fields = ["id", "layout", "content", "background"]
-            
-            for field in required_fields:
-                if field not in slide:
-                    self.error(f"slides[{i}].{field} is required")
-                    valid = False
-            
+            missing = _REQUIRED_SLIDE_SET.difference(slide)
+            if missing:
+                valid = False
+                for field in _REQUIRED_SLIDE:
+                    if field in missing:
+                        err("slides[%s].%s is required", i, field)
+
             # Validate slide ID
-            if "id" in slide:
-                slide_id = slide["id"]
-                valid &= self.validate_slide_id(slide_id)
-                
-                if slide_id in slide_ids:
-                    self.error(f"duplicate slide id: {slide_id}")
-                    valid = False
-                slide_ids.add(slide_id)
-            
+            if (slide_id := slide.get("id", _MISSING)) is not _MISSING:
+                valid = self.validate_slide_id(slide_id) and valid
+                slide_ids.append(slide_id)
+
             # Validate layout
-            if "layout" in slide:
-                valid_layouts = ["title-slide", "lf", "rf", "tb", "tl", "tr", "bl", "br"]
-                if slide["layout"] not in valid_layouts:
-                    self.error(f"slides[{i}].layout must be one of: {valid_layouts}")
-                    valid = False
-            
+            if (layout := slide.get("layout", _MISSING)) is not _MISSING and layout not in _VALID_LAYOUT_SET:
+                err("slides[%s].layout must be one of: %s", i, _VALID_LAYOUTS)
+                valid = False
+
             # Validate background
-            if "background" in slide:
-                background = slide["background"]
-                required_bg_fields = ["filename", "concept", "prompt", "text_zones"]
-                
-                for field in required_bg_fields:
-                    if field not in background:
-                        self.error(f"slides[{i}].background.{field} is required")
-                        valid = False
-                
-                if "filename" in background:
-                    valid &= self.validate_filename_pattern(background["filename"], "slide")
-                
-                if "text_zones" in background:
-                    text_zones = background["text_zones"]
-                    if "primary" not in text_zones:
-                        self.error(f"slides[{i}].background.text_zones.primary is required")
-                        valid = False
-        
+            if (background := slide.get("background", _MISSING)) is not _MISSING:
+                missing = _REQUIRED_BACKGROUND_SET.difference(background)
+                if missing:
+                    valid = False
+                    for field in _REQUIRED_BACKGROUND:
+                        if field in missing:
+                            err("slides[%s].background.%s is required", i, field)
+
+                if (filename := background.get("filename", _MISSING)) is not _MISSING:
+                    valid = self.validate_filename_pattern(filename, "slide") and valid
+
+                if (text_zones := background.get("text_zones", _MISSING)) is not _MISSING and "primary" not in text_zones:
+                    err("slides[%s].background.text_zones.primary is required", i)
+                    valid = False
+
+        # Duplicates are counted in C after the loop instead of paying two
+        # set operations per slide; Counter keeps first-seen order
+        for slide_id, count in Counter(slide_ids).items():
+            if count > 1:
+                err("duplicate slide id: %s", slide_id)
+                valid = False
+
         return valid
     
     def validate_icons(self, icons: Optional[List[Dict[str, Any]]]) -> bool:
@@ -318,169 +400,258 @@ class SchemaValidator:
             return True
         
         valid = True
-        icon_filenames = set()
-        
+        icon_filenames = []
+
         for i, icon in enumerate(icons):
-            required_fields = ["filename", "prompt", "transparent"]
-            
-            for field in required_fields:
-                if field not in icon:
-                    self.error(f"icons[{i}].{field} is required")
-                    valid = False
+            missing = _REQUIRED_ICON_SET.difference(icon)
+            if missing:
+                valid = False
+                for field in _REQUIRED_ICON:
+                    if field in missing:
+                        self.error("icons[%s].%s is required", i, field)
             
-            if "filename" in icon:
-                filename = icon["filename"]
-                valid &= self.validate_filename_pattern(filename, "icon")
-                
-                if filename in icon_filenames:
-                    self.error(f"duplicate icon filename: {filename}")
-                    valid = False
-                icon_filenames.add(filename)
+            filename = icon.get("filename", _MISSING)
+            if filename is not _MISSING:
+                valid = self.validate_filename_pattern(filename, "icon") and valid
+                icon_filenames.append(filename)
             
-            if "transparent" in icon:
-                if not isinstance(icon["transparent"], bool):
-                    self.error(f"icons[{i}].transparent must be boolean")
-                    valid = False
-        
+            transparent = icon.get("transparent", _MISSING)
+            if transparent is not _MISSING and not isinstance(transparent, bool):
+                self.error("icons[%s].transparent must be boolean", i)
+                valid = False
+
+        for filename, count in Counter(icon_filenames).items():
+            if count > 1:
+                self.error("duplicate icon filename: %s", filename)
+                valid = False
+
         return valid
     
     def validate_runtime_config(self, runtime_config: Dict[str, Any]) -> bool:
         """Validate runtime_config section"""
-        required_fields = ["reveal_js", "responsive_breakpoints", "content_sizing"]
+        err = self.error
         valid = True
-        
-        for field in required_fields:
-            if field not in runtime_config:
-                self.error(f"runtime_config.{field} is required")
-                valid = False
+
+        missing = _REQUIRED_RUNTIME_SET.difference(runtime_config)
+        if missing:
+            valid = False
+            for field in _REQUIRED_RUNTIME:
+                if field in missing:
+                    err("runtime_config.%s is required", field)
         
         # Validate reveal_js
-        if "reveal_js" in runtime_config:
-            reveal_js = runtime_config["reveal_js"]
-            required_reveal = ["transition", "transition_speed", "background_transition", "controls", "progress", "keyboard", "touch", "hash"]
-            
-            for field in required_reveal:
-                if field not in reveal_js:
-                    self.error(f"runtime_config.reveal_js.{field} is required")
-                    valid = False
+        reveal_js = runtime_config.get("reveal_js", _MISSING)
+        if reveal_js is not _MISSING:
+            missing = _REQUIRED_REVEAL_SET.difference(reveal_js)
+            if missing:
+                valid = False
+                for field in _REQUIRED_REVEAL:
+                    if field in missing:
+                        err("runtime_config.reveal_js.%s is required", field)
             
             # Validate enum values
-            if "transition" in reveal_js:
-                valid_transitions = ["none", "fade", "slide", "convex", "concave", "zoom"]
-                if reveal_js["transition"] not in valid_transitions:
-                    self.error(f"runtime_config.reveal_js.transition must be one of: {valid_transitions}")
-                    valid = False
-            
-            if "transition_speed" in reveal_js:
-                valid_speeds = ["default", "fast", "slow"]
-                if reveal_js["transition_speed"] not in valid_speeds:
-                    self.error(f"runtime_config.reveal_js.transition_speed must be one of: {valid_speeds}")
-                    valid = False
-        
+            transition = reveal_js.get("transition", _MISSING)
+            if transition is not _MISSING and transition not in _VALID_TRANSITION_SET:
+                err("runtime_config.reveal_js.transition must be one of: %s", _VALID_TRANSITIONS)
+                valid = False
+
+            transition_speed = reveal_js.get("transition_speed", _MISSING)
+            if transition_speed is not _MISSING and transition_speed not in _VALID_SPEED_SET:
+                err("runtime_config.reveal_js.transition_speed must be one of: %s", _VALID_SPEEDS)
+                valid = False
+
         # Validate responsive_breakpoints
-        if "responsive_breakpoints" in runtime_config:
-            breakpoints = runtime_config["responsive_breakpoints"]
-            required_breakpoints = ["tablet", "mobile"]
-            
-            for field in required_breakpoints:
-                if field not in breakpoints:
-                    self.error(f"runtime_config.responsive_breakpoints.{field} is required")
+        breakpoints = runtime_config.get("responsive_breakpoints", _MISSING)
+        if breakpoints is not _MISSING:
+            for field in _REQUIRED_BREAKPOINTS:
+                value = breakpoints.get(field, _MISSING)
+                if value is _MISSING:
+                    err("runtime_config.responsive_breakpoints.%s is required", field)
                     valid = False
-                elif not breakpoints[field].endswith('px'):
-                    self.error(f"runtime_config.responsive_breakpoints.{field} must end with 'px'")
+                elif not value.endswith('px'):
+                    err("runtime_config.responsive_breakpoints.%s must end with 'px'", field)
                     valid = False
         
         return valid
     
+    def _validate_residual(self, data: Dict[str, Any]) -> bool:
+        """Checks the compiled JSON Schema cannot express, run after a
+        document has already passed it: the required/optional layout
+        tables, the per-slide layout enum, duplicate slide ids and icon
+        filenames, and the CSS-unit warnings."""
+        valid = self.validate_layout_system(data["layout_system"])
+
+        typography = data["visual_identity"].get("typography")
+        if typography is not None:
+            for typo_field in _REQUIRED_TYPOGRAPHY:
+                if typo_field != "font_family" and typo_field in typography:
+                    self.validate_css_units(typography[typo_field], f"visual_identity.typography.{typo_field}")
+
+        slides = data["slides"]
+        for i, slide in enumerate(slides):
+            if slide["layout"] not in _VALID_LAYOUT_SET:
+                self.error("slides[%s].layout must be one of: %s", i, _VALID_LAYOUTS)
+                valid = False
+
+        for slide_id, count in Counter(slide["id"] for slide in slides).items():
+            if count > 1:
+                self.error("duplicate slide id: %s", slide_id)
+                valid = False
+
+        for filename, count in Counter(icon["filename"] for icon in data.get("icons") or []).items():
+            if count > 1:
+                self.error("duplicate icon filename: %s", filename)
+                valid = False
+
+        return valid
+
     def validate_presentation(self, data: Dict[str, Any]) -> bool:
         """Validate entire presentation schema"""
-        required_sections = ["meta", "visual_identity", "layout_system", "asset_config", "slides", "runtime_config"]
+        if _fast_validate is not None:
+            try:
+                _fast_validate(data)
+            except fastjsonschema.JsonSchemaException:
+                pass  # invalid somewhere: re-walk for the detailed messages
+            else:
+                return self._validate_residual(data)
+
         valid = True
-        
+
         # Check required top-level sections
-        for section in required_sections:
-            if section not in data:
-                self.error(f"required section '{section}' is missing")
-                valid = False
+        missing = _REQUIRED_SECTION_SET.difference(data)
+        if missing:
+            valid = False
+            for section in _REQUIRED_SECTIONS:
+                if section in missing:
+                    self.error("required section '%s' is missing", section)
         
         # Validate each section
-        if "meta" in data:
-            valid &= self.validate_meta(data["meta"])
-        
-        if "visual_identity" in data:
-            valid &= self.validate_visual_identity(data["visual_identity"])
-        
-        if "layout_system" in data:
-            valid &= self.validate_layout_system(data["layout_system"])
-        
-        if "asset_config" in data:
-            valid &= self.validate_asset_config(data["asset_config"])
-        
-        if "slides" in data:
-            valid &= self.validate_slides(data["slides"])
-        
-        if "icons" in data:
-            valid &= self.validate_icons(data["icons"])
-        
-        if "runtime_config" in data:
-            valid &= self.validate_runtime_config(data["runtime_config"])
+        meta = data.get("meta", _MISSING)
+        if meta is not _MISSING:
+            valid = self.validate_meta(meta) and valid
+
+        visual_identity = data.get("visual_identity", _MISSING)
+        if visual_identity is not _MISSING:
+            valid = self.validate_visual_identity(visual_identity) and valid
+
+        layout_system = data.get("layout_system", _MISSING)
+        if layout_system is not _MISSING:
+            valid = self.validate_layout_system(layout_system) and valid
+
+        asset_config = data.get("asset_config", _MISSING)
+        if asset_config is not _MISSING:
+            valid = self.validate_asset_config(asset_config) and valid
+
+        slides = data.get("slides", _MISSING)
+        if slides is not _MISSING:
+            valid = self.validate_slides(slides) and valid
+
+        # validate_icons treats a missing section as valid on its own
+        valid = self.validate_icons(data.get("icons")) and valid
+
+        runtime_config = data.get("runtime_config", _MISSING)
+        if runtime_config is not _MISSING:
+            valid = self.validate_runtime_config(runtime_config) and valid
         
         return valid
     
     def validate_file(self, file_path: str) -> bool:
         """Validate a presentation JSON file"""
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-                
-            # Check for common JSON errors (but exclude URLs)
-            if '/*' in content or '*/' in content:
+            # Raw bytes straight to the parser: orjson and json both accept
+            # them, which skips the Python-level text decode of the whole
+            # file. Decoding happens per-line, only when reporting an issue.
+            content = Path(file_path).read_bytes()
+
+            # Single pass for common JSON errors: block comments, line
+            # comments (excluding URLs), and trailing commas, each recorded
+            # with its line number and source line
+            block_comments = []
+            line_comment = None
+            trailing_commas = []
+
+            for match in _ISSUE_RE.finditer(content):
+                token = match.group()
+                if token.endswith(b'//') and line_comment is not None:
+                    continue  # only the first line comment is reported
+
+                # Line number and source line recovered from the match
+                # offset in O(offset) C code, only for matches kept
+                line_no = content.count(b'\n', 0, match.start()) + 1
+                line_start = content.rfind(b'\n', 0, match.start()) + 1
+                line_end = content.find(b'\n', match.start())
+                line = content[line_start:line_end if line_end != -1 else len(content)]
+
+                if token == b'/*' or token == b'*/':
+                    # One report per offending line
+                    if not block_comments or block_comments[-1][0] != line_no:
+                        block_comments.append((line_no, line.decode('utf-8', 'replace')))
+                elif token.endswith(b'//'):
+                    if b'http' not in line.strip():
+                        line_comment = (line_no, line.decode('utf-8', 'replace'))
+                else:
+                    if not trailing_commas or trailing_commas[-1][0] != line_no:
+                        trailing_commas.append((line_no, line.decode('utf-8', 'replace')))
+
+            if block_comments:
                 self.error("JSON files cannot contain block comments (/* */). Remove all comments from the file.")
-                lines = content.split('\n')
-                for i, line in enumerate(lines, 1):
-                    if '/*' in line or '*/' in line:
-                        self.error(f"  → Comment found on line {i}: {line.strip()[:60]}...")
+                for line_no, line in block_comments:
+                    self.error("  → Comment found on line %s: %s...", line_no, line.strip()[:60])
                 return False
-            
-            # Check for line comments but exclude URLs
-            lines = content.split('\n')
-            for i, line in enumerate(lines, 1):
-                stripped = line.strip()
-                if stripped.startswith('//') and 'http' not in stripped:
-                    self.error("JSON files cannot contain line comments (//).")
-                    self.error(f"  → Comment found on line {i}: {line.strip()[:60]}...")
-                    return False
-            
-            # Check for trailing commas (common JSON error)
-            if re.search(r',\s*[}\]]', content):
+
+            if line_comment is not None:
+                line_no, line = line_comment
+                self.error("JSON files cannot contain line comments (//).")
+                self.error("  → Comment found on line %s: %s...", line_no, line.strip()[:60])
+                return False
+
+            if trailing_commas:
                 self.error("JSON has trailing commas before closing brackets. Remove commas before } or ]")
-                lines = content.split('\n')
-                for i, line in enumerate(lines, 1):
-                    if re.search(r',\s*[}\]]', line):
-                        self.error(f"  → Trailing comma on line {i}: {line.strip()}")
+                for line_no, line in trailing_commas:
+                    self.error("  → Trailing comma on line %s: %s", line_no, line.strip())
             
-            # Try to parse JSON
+            # Try to parse JSON (re-parse failures with stdlib json so the
+            # error report keeps its lineno/colno detail)
             try:
-                data = json.loads(content)
-            except json.JSONDecodeError as e:
-                self.error(f"JSON parsing error at line {e.lineno}, column {e.colno}")
-                self.error(f"  → Details: {e.msg}")
-                
-                # Show the problematic line
-                lines = content.split('\n')
-                if 0 < e.lineno <= len(lines):
-                    problem_line = lines[e.lineno - 1]
-                    self.error(f"  → Line {e.lineno}: {problem_line.strip()}")
-                    if e.colno:
-                        self.error(f"  → {' ' * 11}{' ' * (e.colno - 1)}^")
-                return False
+                data = _loads(content)
+            except ValueError:
+                try:
+                    data = json.loads(content)
+                except json.JSONDecodeError as e:
+                    self.error("JSON parsing error at line %s, column %s", e.lineno, e.colno)
+                    self.error("  → Details: %s", e.msg)
+
+                    # Show the problematic line (only error paths ever
+                    # decode or split the file body)
+                    lines = content.decode('utf-8', 'replace').splitlines()
+                    if 0 < e.lineno <= len(lines):
+                        problem_line = lines[e.lineno - 1]
+                        self.error("  → Line %s: %s", e.lineno, problem_line.strip())
+                        if e.colno:
+                            self.error("  → %s%s^", ' ' * 11, ' ' * (e.colno - 1))
+                    return False
                 
         except FileNotFoundError:
-            self.error(f"file not found: {file_path}")
+            self.error("file not found: %s", file_path)
             return False
         
         return self.validate_presentation(data)
-    
+
+    @classmethod
+    def validate_many(cls, paths: List[str]) -> Dict[str, bool]:
+        """Validate several files with a single reused validator.
+
+        One instance (and the module-level compiled patterns) serves the
+        whole batch; per-file state is reset between runs.
+        """
+        validator = cls()
+        results = {}
+        for path in paths:
+            validator.reset()
+            results[path] = validator.validate_file(path)
+            validator.print_results(path)
+        return results
+
     def print_results(self, file_path: str):
         """Print validation results"""
         print(f"\n📋 Validating: {file_path}")
@@ -488,13 +659,13 @@ class SchemaValidator:
         
         if self.errors:
             print(f"\n🚨 {len(self.errors)} ERROR(S) FOUND:")
-            for error in self.errors:
-                print(f"  {error}")
-        
+            for message, args in self.errors:
+                print(f"  ❌ ERROR: {message % args if args else message}")
+
         if self.warnings:
             print(f"\n⚠️  {len(self.warnings)} WARNING(S):")
-            for warning in self.warnings:
-                print(f"  {warning}")
+            for message, args in self.warnings:
+                print(f"  ⚠️  WARNING: {message % args if args else message}")
         
         if not self.errors and not self.warnings:
             print("✅ VALIDATION PASSED - No errors or warnings found!")
@@ -504,17 +675,13 @@ class SchemaValidator:
             print(f"❌ VALIDATION FAILED - {len(self.errors)} errors must be fixed")
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python validate_schema.py <presentation.json>")
+    if len(sys.argv) < 2:
+        print("Usage: python validate_schema.py <presentation.json> [more.json ...]")
         sys.exit(1)
-    
-    file_path = sys.argv[1]
-    
-    validator = SchemaValidator()
-    is_valid = validator.validate_file(file_path)
-    validator.print_results(file_path)
-    
-    if not is_valid:
+
+    results = SchemaValidator.validate_many(sys.argv[1:])
+
+    if not all(results.values()):
         sys.exit(1)
 
 if __name__ == "__main__":